@@ -13,11 +13,17 @@ License: MIT
 __version__ = "1.0.0"
 __author__ = "GDMS Intern"
 
-from .collector import HealthCollector
-from .logger import HealthLogger
-from .metrics import collect_all_metrics
-from .processes import collect_process_info
-from .network import collect_network_info
+from importlib import import_module
+
+# Public names and the submodule that defines each. They are imported on first
+# access (PEP 562) so importing the package does not pull in psutil.
+_LAZY_IMPORTS = {
+    "HealthCollector": ".collector",
+    "HealthLogger": ".logger",
+    "collect_all_metrics": ".metrics",
+    "collect_process_info": ".processes",
+    "collect_network_info": ".network"
+}
 
 __all__ = [
     "HealthCollector",
@@ -26,3 +32,17 @@ __all__ = [
     "collect_process_info",
     "collect_network_info"
 ]
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,10 +3,12 @@ Main health collector orchestration module.
 Coordinates collection of all system health metrics.
 """
 
-from typing import Dict, Any
-from .metrics import collect_all_metrics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from .metrics import collect_all_metrics, prime_cpu_percent, CPU_SAMPLE_INTERVAL
 from .processes import collect_process_info
-from .network import collect_network_info
+from .network import collect_network_info, get_raw_connections, iter_network_connections
 from .logger import HealthLogger
 
 
@@ -31,21 +33,50 @@ class HealthCollector:
         self.include_all_connections = include_all_connections
         self.logger = HealthLogger(output_dir=output_dir, format=output_format)
 
-    def collect_all(self) -> Dict[str, Any]:
+        # Connection table from the most recent collect_all(), kept so run()
+        # can stream the full listing without fetching it a second time
+        self._raw_connections: List[Any] = []
+
+        # Start the CPU sampling window now so collection only waits for
+        # whatever part of it has not already elapsed
+        prime_cpu_percent()
+        self._cpu_primed_at = time.monotonic()
+
+    def collect_all(self, include_all_connections: Optional[bool] = None) -> Dict[str, Any]:
         """
         Collect all system health metrics.
 
+        Args:
+            include_all_connections: Override the collector's setting for
+                listing every network connection (None keeps the setting)
+
         Returns:
             Dictionary containing all collected metrics
         """
-        print("Collecting system metrics...")
-        metrics = collect_all_metrics()
+        if include_all_connections is None:
+            include_all_connections = self.include_all_connections
 
-        print("Enumerating processes...")
-        processes = collect_process_info(top_n=self.top_processes)
+        # Process and network enumeration spend their time in psutil system
+        # calls, so they run in worker threads while this thread waits out the
+        # CPU sampling window. The CPU read must stay on this thread: psutil
+        # keeps the cpu_percent() baseline per thread, and it was primed here.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            print("Enumerating processes...")
+            processes_future = executor.submit(collect_process_info, top_n=self.top_processes)
 
-        print("Analyzing network connections...")
-        network = collect_network_info(include_all_connections=self.include_all_connections)
+            print("Analyzing network connections...")
+            network_future = executor.submit(self._collect_network, include_all_connections)
+
+            print("Collecting system metrics...")
+            elapsed = time.monotonic() - self._cpu_primed_at
+            metrics = collect_all_metrics(cpu_sample_interval=max(0.0, CPU_SAMPLE_INTERVAL - elapsed))
+
+            # Reading CPU usage starts psutil's next window, so the next call
+            # waits a full interval again
+            self._cpu_primed_at = time.monotonic()
+
+            processes = processes_future.result()
+            network = network_future.result()
 
         return {
             "metrics": metrics,
@@ -53,6 +84,22 @@ class HealthCollector:
             "network": network
         }
 
+    def _collect_network(self, include_all_connections: bool) -> Dict[str, Any]:
+        """
+        Fetch the connection table once and collect network information from it.
+
+        Args:
+            include_all_connections: If True, include all network connections
+
+        Returns:
+            Dictionary containing network information
+        """
+        self._raw_connections = get_raw_connections()
+        return collect_network_info(
+            include_all_connections=include_all_connections,
+            raw_connections=self._raw_connections
+        )
+
     def run(self) -> str:
         """
         Run the health collector and write results to log file.
@@ -63,12 +110,18 @@ class HealthCollector:
         print("Starting System Health & Integrity Monitor...")
         print("-" * 60)
 
-        # Collect all data
-        data = self.collect_all()
+        # Collect all data. The full connection listing is left out here and
+        # streamed to the log from the same connection table instead, so its
+        # dicts are built one at a time rather than held as one list.
+        data = self.collect_all(include_all_connections=False)
+
+        connections = None
+        if self.include_all_connections:
+            connections = iter_network_connections(self._raw_connections)
 
         # Write to log
         print("\nWriting results to log file...")
-        log_file = self.logger.write_log(data)
+        log_file = self.logger.write_log(data, connections=connections)
 
         print(f"\nHealth monitoring complete!")
         print(f"Report saved to: {log_file}")
@@ -6,8 +6,33 @@ Handles formatting and writing system health data to log files.
 import json
 import platform
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
+
+# Write buffer size for log files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=None)
+def _get_system_info() -> Dict[str, str]:
+    """
+    Gather static host information once per process.
+
+    The cached dict is shared, so callers should copy it before handing it out.
+
+    Returns:
+        Dictionary of hostname, platform and processor details
+    """
+    return {
+        "hostname": platform.node(),
+        "platform": platform.system(),
+        "platform_release": platform.release(),
+        "platform_version": platform.version(),
+        "architecture": platform.machine(),
+        "processor": platform.processor(),
+        "os_version": f"{platform.system()} {platform.release()}"
+    }
 
 
 class HealthLogger:
@@ -25,20 +50,28 @@ class HealthLogger:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.format = format.lower()
 
-    def generate_filename(self) -> str:
+    def generate_filename(self, now: Optional[datetime] = None) -> str:
         """
         Generate a timestamped filename for the log.
 
+        Args:
+            now: Timestamp to use (defaults to the current time)
+
         Returns:
             Filename string
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if now is None:
+            now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         extension = "json" if self.format == "json" else "log"
         return f"health_monitor_{timestamp}.{extension}"
 
     def format_json(self, data: Dict[str, Any]) -> str:
         """
-        Format data as JSON.
+        Format data as a JSON string.
+
+        Only for external callers that need the report as a string;
+        write_log() streams JSON straight to the file instead.
 
         Args:
             data: Data to format
@@ -58,131 +91,164 @@ class HealthLogger:
         Returns:
             Text-formatted string
         """
-        lines = []
-        lines.append("=" * 80)
-        lines.append("SYSTEM HEALTH & INTEGRITY MONITOR REPORT")
-        lines.append("=" * 80)
-        lines.append(f"Timestamp: {data['timestamp']}")
-        lines.append(f"Hostname: {data['system_info']['hostname']}")
-        lines.append(f"Platform: {data['system_info']['platform']}")
-        lines.append(f"OS: {data['system_info']['os_version']}")
-        lines.append("")
-
-        # CPU Metrics
-        lines.append("-" * 80)
-        lines.append("CPU METRICS")
-        lines.append("-" * 80)
+        heavy = "=" * 80
+        rule = "-" * 80
+        system_info = data['system_info']
         cpu = data['metrics']['cpu']
-        lines.append(f"Overall Usage: {cpu['cpu_percent']}%")
-        lines.append(f"Logical CPUs: {cpu['cpu_count_logical']}")
-        lines.append(f"Physical CPUs: {cpu['cpu_count_physical']}")
-        lines.append(f"Per-Core Usage: {cpu['cpu_per_core']}")
-        lines.append("")
-
-        # Memory Metrics
-        lines.append("-" * 80)
-        lines.append("MEMORY METRICS")
-        lines.append("-" * 80)
         mem = data['metrics']['memory']
-        lines.append(f"Total: {mem['total_gb']} GB")
-        lines.append(f"Available: {mem['available_gb']} GB")
-        lines.append(f"Used: {mem['used_gb']} GB ({mem['percent']}%)")
-        lines.append(f"Swap Used: {mem['swap_percent']}%")
-        lines.append("")
-
-        # Disk Metrics
-        lines.append("-" * 80)
-        lines.append("DISK METRICS")
-        lines.append("-" * 80)
-        for mount, disk in data['metrics']['disk'].items():
-            lines.append(f"\nMount: {mount}")
-            lines.append(f"  Device: {disk['device']}")
-            lines.append(f"  Type: {disk['fstype']}")
-            lines.append(f"  Total: {disk['total_gb']} GB")
-            lines.append(f"  Used: {disk['used_gb']} GB ({disk['percent']}%)")
-            lines.append(f"  Free: {disk['free_gb']} GB")
-        lines.append("")
-
-        # Process Summary
-        lines.append("-" * 80)
-        lines.append("PROCESS SUMMARY")
-        lines.append("-" * 80)
         proc_summary = data['processes']['summary']
-        lines.append(f"Total Processes: {proc_summary['total_processes']}")
-        lines.append(f"Running: {proc_summary['running']}")
-        lines.append(f"Sleeping: {proc_summary['sleeping']}")
-        lines.append(f"Stopped: {proc_summary['stopped']}")
-        lines.append(f"Zombie: {proc_summary['zombie']}")
-        lines.append("")
-
-        # Top Processes by Memory
-        lines.append("-" * 80)
-        lines.append("TOP PROCESSES BY MEMORY")
-        lines.append("-" * 80)
-        lines.append(f"{'PID':<10} {'Name':<30} {'User':<15} {'Memory %':<12} {'Memory MB':<12}")
-        lines.append("-" * 80)
-        for proc in data['processes']['top_processes_by_memory'][:10]:
-            lines.append(
-                f"{proc['pid']:<10} {proc['name'][:28]:<30} "
-                f"{proc['username'][:13]:<15} {proc['memory_percent']:<12.2f} {proc['memory_mb']:<12.2f}"
-            )
-        lines.append("")
-
-        # Network Summary
-        lines.append("-" * 80)
-        lines.append("NETWORK SUMMARY")
-        lines.append("-" * 80)
         net_summary = data['network']['summary']
-        lines.append(f"Total Connections: {net_summary['total_connections']}")
-        lines.append(f"Connections by Status: {net_summary['by_status']}")
-        lines.append(f"Connections by Protocol: {net_summary['by_protocol']}")
-        lines.append(f"\nListening Ports ({len(net_summary['listening_ports'])}):")
-        for port_info in net_summary['listening_ports'][:20]:
-            lines.append(f"  Port {port_info['port']}: {port_info['address']} (PID: {port_info['pid']})")
-        lines.append("")
-
-        lines.append("=" * 80)
-        lines.append("END OF REPORT")
-        lines.append("=" * 80)
-
-        return "\n".join(lines)
 
-    def write_log(self, data: Dict[str, Any]) -> str:
+        # Repeated sections are built as one string each, every entry prefixed by a newline
+        disk_block = "".join(
+            f"\n\nMount: {mount}"
+            f"\n  Device: {disk['device']}"
+            f"\n  Type: {disk['fstype']}"
+            f"\n  Total: {disk['total_gb']} GB"
+            f"\n  Used: {disk['used_gb']} GB ({disk['percent']}%)"
+            f"\n  Free: {disk['free_gb']} GB"
+            for mount, disk in data['metrics']['disk'].items()
+        )
+        process_block = "".join(
+            f"\n{proc['pid']:<10} {proc['name'][:28]:<30} "
+            f"{proc['username'][:13]:<15} {proc['memory_percent']:<12.2f} {proc['memory_mb']:<12.2f}"
+            for proc in data['processes']['top_processes_by_memory'][:10]
+        )
+        connections_file = data['network'].get('all_connections_file')
+        connections_line = f"\nAll Connections: {connections_file}" if connections_file else ""
+        port_block = "".join(
+            f"\n  Port {port_info['port']}: {port_info['address']} (PID: {port_info['pid']})"
+            for port_info in net_summary['listening_ports'][:20]
+        )
+
+        return f"""{heavy}
+SYSTEM HEALTH & INTEGRITY MONITOR REPORT
+{heavy}
+Timestamp: {data['timestamp']}
+Hostname: {system_info['hostname']}
+Platform: {system_info['platform']}
+OS: {system_info['os_version']}
+
+{rule}
+CPU METRICS
+{rule}
+Overall Usage: {cpu['cpu_percent']}%
+Logical CPUs: {cpu['cpu_count_logical']}
+Physical CPUs: {cpu['cpu_count_physical']}
+Per-Core Usage: {cpu['cpu_per_core']}
+
+{rule}
+MEMORY METRICS
+{rule}
+Total: {mem['total_gb']} GB
+Available: {mem['available_gb']} GB
+Used: {mem['used_gb']} GB ({mem['percent']}%)
+Swap Used: {mem['swap_percent']}%
+
+{rule}
+DISK METRICS
+{rule}{disk_block}
+
+{rule}
+PROCESS SUMMARY
+{rule}
+Total Processes: {proc_summary['total_processes']}
+Running: {proc_summary['running']}
+Sleeping: {proc_summary['sleeping']}
+Stopped: {proc_summary['stopped']}
+Zombie: {proc_summary['zombie']}
+
+{rule}
+TOP PROCESSES BY MEMORY
+{rule}
+{'PID':<10} {'Name':<30} {'User':<15} {'Memory %':<12} {'Memory MB':<12}
+{rule}{process_block}
+
+{rule}
+NETWORK SUMMARY
+{rule}
+Total Connections: {net_summary['total_connections']}
+Connections by Status: {net_summary['by_status']}
+Connections by Protocol: {net_summary['by_protocol']}{connections_line}
+
+Listening Ports ({len(net_summary['listening_ports'])}):{port_block}
+
+{heavy}
+END OF REPORT
+{heavy}"""
+
+    def write_log(self, data: Dict[str, Any],
+                  connections: Optional[Iterable[Dict[str, Any]]] = None) -> str:
         """
         Write health monitoring data to a log file.
 
+        The full connection listing, taken from connections if given or else
+        from data['network']['all_connections'], is written to a JSON-lines
+        sidecar file next to the log.
+
         Args:
             data: Complete health monitoring data
+            connections: Optional iterable of connection dictionaries to stream
 
         Returns:
             Path to the created log file
         """
+        # One timestamp for both the payload and the filename
+        now = datetime.now()
+        filename = self.generate_filename(now)
+        filepath = self.output_dir / filename
+
+        # The full connection listing goes to a JSON-lines sidecar file to keep
+        # the report small
+        network = data.get("network")
+        if network and "all_connections" in network:
+            network = dict(network)
+            listed = network.pop("all_connections")
+            if connections is None:
+                connections = listed
+
+        if connections is not None:
+            network = dict(network or {})
+            connections_path = Path(f"{filepath}.connections.jsonl")
+            network["all_connections_file"] = str(connections_path)
+            data = {**data, "network": network}
+
         # Add system info and timestamp
         enhanced_data = {
-            "timestamp": datetime.now().isoformat(),
-            "system_info": {
-                "hostname": platform.node(),
-                "platform": platform.system(),
-                "platform_release": platform.release(),
-                "platform_version": platform.version(),
-                "architecture": platform.machine(),
-                "processor": platform.processor(),
-                "os_version": f"{platform.system()} {platform.release()}"
-            },
+            "timestamp": now.isoformat(),
+            "system_info": dict(_get_system_info()),
             **data
         }
 
-        # Format data
+        # Write to file
         if self.format == "json":
-            content = self.format_json(enhanced_data)
+            # Stream straight into the file rather than building the whole document in memory
+            with open(filepath, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+                json.dump(enhanced_data, f, indent=2, default=str)
         else:
-            content = self.format_text(enhanced_data)
+            # Encode the finished report once and skip newline translation
+            with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(self.format_text(enhanced_data).encode('utf-8'))
 
-        # Write to file
-        filename = self.generate_filename()
-        filepath = self.output_dir / filename
+        if connections is not None:
+            self.write_connections(connections, connections_path)
+
+        return str(filepath)
 
-        with open(filepath, 'w') as f:
-            f.write(content)
+    def write_connections(self, connections: Iterable[Dict[str, Any]], filepath: Path) -> str:
+        """
+        Write network connections to a JSON-lines file, one connection per line.
+
+        Args:
+            connections: Iterable of connection dictionaries
+            filepath: Path of the file to write
+
+        Returns:
+            Path to the created file
+        """
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+            for conn in connections:
+                f.write(json.dumps(conn, default=str))
+                f.write("\n")
 
         return str(filepath)
@@ -3,14 +3,53 @@ System metrics collection module.
 Collects CPU, memory, and disk usage statistics.
 """
 
+import threading
+import time
 import psutil
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+# Default length of the CPU usage sampling window in seconds
+CPU_SAMPLE_INTERVAL = 1.0
 
-def collect_cpu_metrics() -> Dict[str, Any]:
+# CPU counts never change for the lifetime of the process
+_CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True)
+_CPU_COUNT_PHYSICAL = psutil.cpu_count(logical=False)
+
+# Pseudo and virtual filesystems whose usage is not worth a statvfs call
+_SKIP_FS = frozenset({
+    'tmpfs', 'devtmpfs', 'squashfs', 'overlay', 'overlayfs', 'proc', 'sysfs',
+    'cgroup', 'cgroup2', 'devpts', 'autofs', 'fuse.gvfsd-fuse', 'nsfs', 'tracefs'
+})
+
+# Seconds to wait for disk usage of all partitions (e.g. stale network mounts)
+DISK_USAGE_TIMEOUT = 2.0
+
+_BYTES_TO_GB = 1.0 / (1024 ** 3)
+
+
+def prime_cpu_percent() -> None:
+    """
+    Start a new CPU usage sampling window.
+
+    psutil reports non-blocking CPU usage relative to the previous call, so
+    calling this ahead of collect_cpu_metrics() lets the sampling window
+    overlap with other work instead of sleeping for it. psutil tracks the
+    baseline per thread, so collect_cpu_metrics() must run on the same thread.
+    """
+    psutil.cpu_percent(interval=None)
+    psutil.cpu_percent(interval=None, percpu=True)
+
+
+def collect_cpu_metrics(sample_interval: Optional[float] = None) -> Dict[str, Any]:
     """
     Collect CPU usage metrics.
 
+    Args:
+        sample_interval: Seconds to wait before reading CPU usage, for callers
+            that already started the window with prime_cpu_percent() on this
+            thread. If None, a new window is primed here and sampled for
+            CPU_SAMPLE_INTERVAL seconds.
+
     Returns:
         Dictionary containing CPU metrics including:
         - cpu_percent: Overall CPU usage percentage
@@ -18,11 +57,18 @@ def collect_cpu_metrics() -> Dict[str, Any]:
         - cpu_count_physical: Number of physical CPUs
         - cpu_per_core: List of per-core usage percentages
     """
+    if sample_interval is None:
+        prime_cpu_percent()
+        sample_interval = CPU_SAMPLE_INTERVAL
+
+    if sample_interval > 0:
+        time.sleep(sample_interval)
+
     return {
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "cpu_count_logical": psutil.cpu_count(logical=True),
-        "cpu_count_physical": psutil.cpu_count(logical=False),
-        "cpu_per_core": psutil.cpu_percent(interval=1, percpu=True)
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "cpu_count_logical": _CPU_COUNT_LOGICAL,
+        "cpu_count_physical": _CPU_COUNT_PHYSICAL,
+        "cpu_per_core": psutil.cpu_percent(interval=None, percpu=True)
     }
 
 
@@ -48,15 +94,29 @@ def collect_memory_metrics() -> Dict[str, Any]:
         "available": mem.available,
         "used": mem.used,
         "percent": mem.percent,
-        "total_gb": round(mem.total / (1024**3), 2),
-        "available_gb": round(mem.available / (1024**3), 2),
-        "used_gb": round(mem.used / (1024**3), 2),
+        "total_gb": round(mem.total * _BYTES_TO_GB, 2),
+        "available_gb": round(mem.available * _BYTES_TO_GB, 2),
+        "used_gb": round(mem.used * _BYTES_TO_GB, 2),
         "swap_total": swap.total,
         "swap_used": swap.used,
         "swap_percent": swap.percent
     }
 
 
+def _query_disk_usage(mountpoint: str, results: Dict[str, Any]) -> None:
+    """
+    Store disk usage (or the error raised) for a mount point in results.
+
+    Args:
+        mountpoint: Mount point to query
+        results: Dictionary to store the result in, keyed by mount point
+    """
+    try:
+        results[mountpoint] = psutil.disk_usage(mountpoint)
+    except OSError as e:
+        results[mountpoint] = e
+
+
 def collect_disk_metrics() -> Dict[str, Any]:
     """
     Collect disk usage metrics for all mounted partitions.
@@ -69,39 +129,64 @@ def collect_disk_metrics() -> Dict[str, Any]:
         - free: Free disk space in bytes
         - percent: Disk usage percentage
     """
-    partitions = psutil.disk_partitions()
+    partitions = [
+        partition for partition in psutil.disk_partitions(all=False)
+        if partition.fstype not in _SKIP_FS
+    ]
     disk_info = {}
 
+    # Query each partition on a daemon thread so an unresponsive mount cannot
+    # stall the run. A query that never returns leaves its thread behind, but
+    # daemon threads are not joined at interpreter exit, so the CLI still exits.
+    results = {}
+    threads = []
+    for partition in partitions:
+        thread = threading.Thread(
+            target=_query_disk_usage,
+            args=(partition.mountpoint, results),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+    for thread in threads:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
     for partition in partitions:
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
-            disk_info[partition.mountpoint] = {
-                "device": partition.device,
-                "fstype": partition.fstype,
-                "total": usage.total,
-                "used": usage.used,
-                "free": usage.free,
-                "percent": usage.percent,
-                "total_gb": round(usage.total / (1024**3), 2),
-                "used_gb": round(usage.used / (1024**3), 2),
-                "free_gb": round(usage.free / (1024**3), 2)
-            }
-        except (PermissionError, OSError):
-            # Skip partitions we can't access
+        usage = results.get(partition.mountpoint)
+        if usage is None or isinstance(usage, OSError):
+            # Skip partitions we can't access or that did not answer in time
             continue
 
+        disk_info[partition.mountpoint] = {
+            "device": partition.device,
+            "fstype": partition.fstype,
+            "total": usage.total,
+            "used": usage.used,
+            "free": usage.free,
+            "percent": usage.percent,
+            "total_gb": round(usage.total * _BYTES_TO_GB, 2),
+            "used_gb": round(usage.used * _BYTES_TO_GB, 2),
+            "free_gb": round(usage.free * _BYTES_TO_GB, 2)
+        }
+
     return disk_info
 
 
-def collect_all_metrics() -> Dict[str, Any]:
+def collect_all_metrics(cpu_sample_interval: Optional[float] = None) -> Dict[str, Any]:
     """
     Collect all system metrics (CPU, memory, disk).
 
+    Args:
+        cpu_sample_interval: Remaining seconds of a CPU window already primed
+            on this thread, or None to sample a fresh window
+
     Returns:
         Dictionary containing all system metrics organized by category
     """
     return {
-        "cpu": collect_cpu_metrics(),
+        "cpu": collect_cpu_metrics(sample_interval=cpu_sample_interval),
         "memory": collect_memory_metrics(),
         "disk": collect_disk_metrics()
     }
@@ -3,20 +3,54 @@ Network connections monitoring module.
 Collects information about active network connections and network interfaces.
 """
 
+import socket
 import psutil
-from typing import List, Dict, Any
-from collections import defaultdict
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Iterator, Optional
+from collections import Counter
 
+# Protocol names for the socket types counted in the summary
+_PROTOCOL_BY_TYPE = {
+    socket.SOCK_STREAM: "TCP",
+    socket.SOCK_DGRAM: "UDP"
+}
 
-def collect_network_connections() -> List[Dict[str, Any]]:
+# Short address family names used in the connection listing
+_FAMILY_NAMES = {
+    socket.AF_INET: "INET",
+    socket.AF_INET6: "INET6"
+}
+
+
+def get_raw_connections() -> List[Any]:
     """
-    Collect information about all active network connections.
+    Fetch raw inet connection tuples from psutil.
 
     Returns:
-        List of dictionaries containing connection information including:
+        List of psutil connection namedtuples (empty if access is denied)
+    """
+    try:
+        return psutil.net_connections(kind='inet')
+    except psutil.AccessDenied:
+        # May need elevated privileges on some systems
+        return []
+
+
+def iter_network_connections(raw_connections: Optional[List[Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield information about each active network connection.
+
+    Connection dicts are built one at a time, so callers that stream them
+    (e.g. to a file) never hold a dict for every connection at once.
+
+    Args:
+        raw_connections: Previously fetched psutil connections to reuse
+
+    Yields:
+        Dictionary containing connection information including:
         - fd: File descriptor
-        - family: Address family (AF_INET, AF_INET6)
-        - type: Socket type (SOCK_STREAM, SOCK_DGRAM)
+        - family: Address family ('INET' or 'INET6')
+        - type: Protocol ('TCP' or 'UDP')
         - local_address: Local IP address
         - local_port: Local port
         - remote_address: Remote IP address
@@ -24,35 +58,46 @@ def collect_network_connections() -> List[Dict[str, Any]]:
         - status: Connection status
         - pid: Process ID owning the connection
     """
-    connections = []
+    if raw_connections is None:
+        raw_connections = get_raw_connections()
+
+    for conn in raw_connections:
+        try:
+            yield {
+                "fd": conn.fd,
+                "family": _FAMILY_NAMES.get(conn.family, str(int(conn.family))),
+                "type": _PROTOCOL_BY_TYPE.get(conn.type, str(int(conn.type))),
+                "local_address": conn.laddr.ip if conn.laddr else "N/A",
+                "local_port": conn.laddr.port if conn.laddr else "N/A",
+                "remote_address": conn.raddr.ip if conn.raddr else "N/A",
+                "remote_port": conn.raddr.port if conn.raddr else "N/A",
+                "status": conn.status,
+                "pid": conn.pid or "N/A"
+            }
+        except (AttributeError, psutil.AccessDenied):
+            continue
 
-    try:
-        for conn in psutil.net_connections(kind='inet'):
-            try:
-                connections.append({
-                    "fd": conn.fd,
-                    "family": str(conn.family),
-                    "type": str(conn.type),
-                    "local_address": conn.laddr.ip if conn.laddr else "N/A",
-                    "local_port": conn.laddr.port if conn.laddr else "N/A",
-                    "remote_address": conn.raddr.ip if conn.raddr else "N/A",
-                    "remote_port": conn.raddr.port if conn.raddr else "N/A",
-                    "status": conn.status,
-                    "pid": conn.pid or "N/A"
-                })
-            except (AttributeError, psutil.AccessDenied):
-                continue
-    except psutil.AccessDenied:
-        # May need elevated privileges on some systems
-        pass
 
-    return connections
+def collect_network_connections(raw_connections: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Collect information about all active network connections.
+
+    Args:
+        raw_connections: Previously fetched psutil connections to reuse
+
+    Returns:
+        List of connection dictionaries as yielded by iter_network_connections()
+    """
+    return list(iter_network_connections(raw_connections))
 
 
-def get_network_summary() -> Dict[str, Any]:
+def get_network_summary(raw_connections: Optional[List[Any]] = None) -> Dict[str, Any]:
     """
     Get a summary of network connections grouped by status.
 
+    Args:
+        raw_connections: Previously fetched psutil connections to reuse
+
     Returns:
         Dictionary containing:
         - total_connections: Total number of connections
@@ -60,34 +105,34 @@ def get_network_summary() -> Dict[str, Any]:
         - by_protocol: Count of connections by protocol
         - listening_ports: List of ports in LISTEN state
     """
-    connections = collect_network_connections()
-
-    status_count = defaultdict(int)
-    protocol_count = defaultdict(int)
-    listening_ports = []
-
-    for conn in connections:
-        status_count[conn["status"]] += 1
-
-        # Determine protocol from type
-        if "STREAM" in conn["type"]:
-            protocol_count["TCP"] += 1
-        elif "DGRAM" in conn["type"]:
-            protocol_count["UDP"] += 1
-
-        # Collect listening ports
-        if conn["status"] == "LISTEN" and conn["local_port"] != "N/A":
-            listening_ports.append({
-                "port": conn["local_port"],
-                "address": conn["local_address"],
-                "pid": conn["pid"]
-            })
+    if raw_connections is None:
+        raw_connections = get_raw_connections()
+
+    # Counter consumes C-level map iterators, so tallying runs without a Python loop
+    status_count = Counter(map(attrgetter("status"), raw_connections))
+    type_count = Counter(map(attrgetter("type"), raw_connections))
+    protocol_count = {
+        protocol: type_count[sock_type]
+        for sock_type, protocol in _PROTOCOL_BY_TYPE.items()
+        if type_count[sock_type]
+    }
+
+    # Only listening sockets are materialized as dicts
+    listening_ports = [
+        {
+            "port": conn.laddr.port,
+            "address": conn.laddr.ip,
+            "pid": conn.pid or "N/A"
+        }
+        for conn in raw_connections
+        if conn.status == psutil.CONN_LISTEN and conn.laddr
+    ]
 
     return {
-        "total_connections": len(connections),
+        "total_connections": len(raw_connections),
         "by_status": dict(status_count),
         "by_protocol": dict(protocol_count),
-        "listening_ports": sorted(listening_ports, key=lambda x: x["port"])
+        "listening_ports": sorted(listening_ports, key=itemgetter("port"))
     }
 
 
@@ -149,22 +194,28 @@ def collect_network_interfaces() -> Dict[str, Any]:
     return interfaces
 
 
-def collect_network_info(include_all_connections: bool = False) -> Dict[str, Any]:
+def collect_network_info(include_all_connections: bool = False,
+                         raw_connections: Optional[List[Any]] = None) -> Dict[str, Any]:
     """
     Collect comprehensive network information.
 
     Args:
         include_all_connections: If True, include all connections; otherwise just summary
+        raw_connections: Previously fetched psutil connections to reuse
 
     Returns:
         Dictionary containing network summary, interfaces, and optionally all connections
     """
+    # Fetch the connection table once for both the summary and the full listing
+    if raw_connections is None:
+        raw_connections = get_raw_connections()
+
     info = {
-        "summary": get_network_summary(),
+        "summary": get_network_summary(raw_connections),
         "interfaces": collect_network_interfaces()
     }
 
     if include_all_connections:
-        info["all_connections"] = collect_network_connections()
+        info["all_connections"] = collect_network_connections(raw_connections)
 
     return info
@@ -3,8 +3,142 @@ Process enumeration module.
 Collects information about running processes on the system.
 """
 
+import heapq
+import os
+import sys
+import time
 import psutil
-from typing import List, Dict, Any
+from operator import attrgetter
+from typing import List, Dict, Any, Tuple
+
+# Attributes fetched for every process in a single /proc pass
+_PROCESS_ATTRS = ['pid', 'name', 'username', 'status', 'cpu_percent',
+                  'memory_percent', 'memory_info', 'num_threads', 'create_time']
+
+# Seconds between priming and reading per-process CPU usage
+PROCESS_CPU_SAMPLE_INTERVAL = 0.1
+
+_BYTES_TO_MB = 1.0 / (1024 ** 2)
+
+
+class _ProcessRecord:
+    """Lightweight per-process row; only the rows that get reported become dicts."""
+
+    __slots__ = ('pid', 'name', 'username', 'status', 'cpu_percent',
+                 'memory_percent', 'rss', 'num_threads', 'create_time')
+
+    def __init__(self, pid, name, username, status, cpu_percent,
+                 memory_percent, rss, num_threads, create_time):
+        self.pid = pid
+        self.name = name
+        self.username = username
+        self.status = status
+        self.cpu_percent = cpu_percent
+        self.memory_percent = memory_percent
+        self.rss = rss
+        self.num_threads = num_threads
+        self.create_time = create_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a report dictionary, rounding display values."""
+        return {
+            "pid": self.pid,
+            "name": self.name,
+            "username": self.username,
+            "status": self.status,
+            "cpu_percent": self.cpu_percent,
+            "memory_percent": round(self.memory_percent, 2),
+            "memory_mb": round(self.rss * _BYTES_TO_MB, 2),
+            "num_threads": self.num_threads,
+            "create_time": self.create_time
+        }
+
+
+# Linux /proc/<pid>/stat state codes for the states counted in the summary
+_PROC_STAT_STATES = {
+    b"R": "running",
+    b"S": "sleeping",
+    b"T": "stopped",
+    b"Z": "zombie"
+}
+
+
+def _new_status_count() -> Dict[str, int]:
+    """Return a zeroed counter of process states."""
+    return {
+        "running": 0,
+        "sleeping": 0,
+        "stopped": 0,
+        "zombie": 0,
+        "other": 0
+    }
+
+
+def _build_summary(status_count: Dict[str, int]) -> Dict[str, Any]:
+    """Build the process summary dictionary from status counts."""
+    return {
+        "total_processes": sum(status_count.values()),
+        **status_count
+    }
+
+
+def _prime_process_cpu_percent() -> None:
+    """
+    Set a CPU time baseline for every process.
+
+    psutil reports 0.0 on the first cpu_percent() call for a process.
+    process_iter() caches Process instances between calls, so the next walk
+    reads usage measured since this baseline.
+    """
+    for proc in psutil.process_iter():
+        try:
+            proc.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+
+
+def _collect_processes_once(cpu_sample_interval: float = PROCESS_CPU_SAMPLE_INTERVAL
+                            ) -> Tuple[List[_ProcessRecord], Dict[str, int]]:
+    """
+    Walk the process table once, collecting per-process details and status counts.
+
+    Args:
+        cpu_sample_interval: Seconds to measure per-process CPU usage over
+
+    Returns:
+        Tuple of (list of process records, status counts)
+    """
+    _prime_process_cpu_percent()
+    time.sleep(cpu_sample_interval)
+
+    processes = []
+    status_count = _new_status_count()
+
+    for proc in psutil.process_iter(_PROCESS_ATTRS):
+        try:
+            pinfo = proc.info
+            processes.append(_ProcessRecord(
+                pinfo['pid'],
+                pinfo['name'],
+                pinfo['username'] or "N/A",
+                pinfo['status'],
+                pinfo['cpu_percent'] or 0.0,
+                pinfo['memory_percent'] or 0.0,
+                pinfo['memory_info'].rss if pinfo['memory_info'] else 0,
+                pinfo['num_threads'],
+                pinfo['create_time']
+            ))
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            # Process terminated or we don't have permission
+            continue
+
+        status = pinfo['status']
+        if status in status_count:
+            status_count[status] += 1
+        else:
+            status_count["other"] += 1
+
+    return processes, status_count
 
 
 def enumerate_processes(sort_by: str = "memory", limit: int = None) -> List[Dict[str, Any]]:
@@ -27,64 +161,68 @@ def enumerate_processes(sort_by: str = "memory", limit: int = None) -> List[Dict
         - num_threads: Number of threads
         - create_time: Process creation timestamp
     """
-    processes = []
-
-    for proc in psutil.process_iter(['pid', 'name', 'username', 'status',
-                                     'cpu_percent', 'memory_percent',
-                                     'memory_info', 'num_threads', 'create_time']):
-        try:
-            pinfo = proc.info
-            processes.append({
-                "pid": pinfo['pid'],
-                "name": pinfo['name'],
-                "username": pinfo['username'] or "N/A",
-                "status": pinfo['status'],
-                "cpu_percent": pinfo['cpu_percent'] or 0.0,
-                "memory_percent": round(pinfo['memory_percent'] or 0.0, 2),
-                "memory_mb": round(pinfo['memory_info'].rss / (1024**2), 2) if pinfo['memory_info'] else 0,
-                "num_threads": pinfo['num_threads'],
-                "create_time": pinfo['create_time']
-            })
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            # Process terminated or we don't have permission
-            continue
+    processes, _ = _collect_processes_once()
 
-    # Sort processes
+    # Pick the sort key and direction
     if sort_by == "memory":
-        processes.sort(key=lambda x: x["memory_percent"], reverse=True)
+        key, descending = attrgetter("memory_percent"), True
     elif sort_by == "cpu":
-        processes.sort(key=lambda x: x["cpu_percent"], reverse=True)
+        key, descending = attrgetter("cpu_percent"), True
     elif sort_by == "pid":
-        processes.sort(key=lambda x: x["pid"])
+        key, descending = attrgetter("pid"), False
     elif sort_by == "name":
-        processes.sort(key=lambda x: x["name"].lower())
+        key, descending = lambda x: x.name.lower(), False
+    else:
+        return [p.to_dict() for p in (processes[:limit] if limit else processes)]
 
-    # Apply limit if specified
+    # Partial selection is cheaper than a full sort when only the top few are wanted
     if limit:
-        processes = processes[:limit]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return [p.to_dict() for p in select(limit, processes, key=key)]
 
-    return processes
+    processes.sort(key=key, reverse=descending)
+    return [p.to_dict() for p in processes]
 
 
-def get_process_summary() -> Dict[str, Any]:
+def _count_statuses_from_proc(proc_root: str = "/proc") -> Dict[str, int]:
     """
-    Get a high-level summary of running processes.
+    Count process states by reading /proc/<pid>/stat directly (Linux only).
+
+    Args:
+        proc_root: Path of the proc filesystem
 
     Returns:
-        Dictionary containing:
-        - total_processes: Total number of running processes
-        - running: Number of processes in running state
-        - sleeping: Number of processes in sleeping state
-        - stopped: Number of processes in stopped state
-        - zombie: Number of zombie processes
+        Status counts keyed like _new_status_count()
     """
-    status_count = {
-        "running": 0,
-        "sleeping": 0,
-        "stopped": 0,
-        "zombie": 0,
-        "other": 0
-    }
+    status_count = _new_status_count()
+
+    with os.scandir(proc_root) as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "stat"), "rb") as f:
+                    buf = f.read()
+            except OSError:
+                # Process exited between listing and reading
+                continue
+
+            # The state follows the parenthesised command name, which may itself contain ')'
+            end = buf.rfind(b")")
+            state = buf[end + 2:end + 3]
+            status_count[_PROC_STAT_STATES.get(state, "other")] += 1
+
+    return status_count
+
+
+def _count_statuses_from_psutil() -> Dict[str, int]:
+    """
+    Count process states through psutil (portable fallback).
+
+    Returns:
+        Status counts keyed like _new_status_count()
+    """
+    status_count = _new_status_count()
 
     for proc in psutil.process_iter(['status']):
         try:
@@ -96,12 +234,25 @@ def get_process_summary() -> Dict[str, Any]:
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
 
-    total = sum(status_count.values())
+    return status_count
 
-    return {
-        "total_processes": total,
-        **status_count
-    }
+
+def get_process_summary() -> Dict[str, Any]:
+    """
+    Get a high-level summary of running processes.
+
+    Returns:
+        Dictionary containing:
+        - total_processes: Total number of running processes
+        - running: Number of processes in running state
+        - sleeping: Number of processes in sleeping state
+        - stopped: Number of processes in stopped state
+        - zombie: Number of zombie processes
+    """
+    if sys.platform.startswith("linux"):
+        return _build_summary(_count_statuses_from_proc())
+
+    return _build_summary(_count_statuses_from_psutil())
 
 
 def collect_process_info(top_n: int = 20) -> Dict[str, Any]:
@@ -114,8 +265,15 @@ def collect_process_info(top_n: int = 20) -> Dict[str, Any]:
     Returns:
         Dictionary containing process summary and top processes
     """
+    # One walk of the process table feeds the summary and both rankings
+    processes, status_count = _collect_processes_once()
+
     return {
-        "summary": get_process_summary(),
-        "top_processes_by_memory": enumerate_processes(sort_by="memory", limit=top_n),
-        "top_processes_by_cpu": enumerate_processes(sort_by="cpu", limit=top_n)
+        "summary": _build_summary(status_count),
+        "top_processes_by_memory": [
+            p.to_dict() for p in heapq.nlargest(top_n, processes, key=attrgetter("memory_percent"))
+        ],
+        "top_processes_by_cpu": [
+            p.to_dict() for p in heapq.nlargest(top_n, processes, key=attrgetter("cpu_percent"))
+        ]
     }
@@ -13,7 +13,6 @@ Author: GDMS Intern Project
 
 import argparse
 import sys
-from health_monitor import HealthCollector
 
 
 def parse_arguments():
@@ -82,6 +81,9 @@ def main():
     try:
         args = parse_arguments()
 
+        # Imported here so --help and --version don't load psutil
+        from health_monitor import HealthCollector
+
         # Create and run collector
         collector = HealthCollector(
             top_processes=args.top_processes,
@@ -0,0 +1,60 @@
+"""
+Tests for the health collector orchestration.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import psutil
+
+from health_monitor import HealthCollector
+from health_monitor.metrics import CPU_SAMPLE_INTERVAL
+
+
+def test_collect_all_reports_cpu_usage_of_busy_process(tmp_path):
+    """CPU usage is read on the thread that primed it, so load shows up."""
+    busy = subprocess.Popen([sys.executable, "-c", "while True: pass"])
+    try:
+        collector = HealthCollector(top_processes=5, output_dir=str(tmp_path))
+        cpu = collector.collect_all()["metrics"]["cpu"]
+    finally:
+        busy.kill()
+        busy.wait()
+
+    assert cpu["cpu_percent"] > 0.0
+    assert sum(cpu["cpu_per_core"]) > 0.0
+
+
+def test_repeated_collect_all_waits_a_full_cpu_window(tmp_path):
+    """Each collect_all() call samples CPU over a full window, not just the first."""
+    collector = HealthCollector(top_processes=5, output_dir=str(tmp_path))
+    collector.collect_all()
+
+    start = time.monotonic()
+    collector.collect_all()
+
+    assert time.monotonic() - start >= CPU_SAMPLE_INTERVAL * 0.9
+
+
+def test_run_streams_connections_from_a_single_fetch(tmp_path, monkeypatch):
+    """run() lists the same connection table that the summary counts."""
+    calls = []
+    net_connections = psutil.net_connections
+
+    def counting_net_connections(*args, **kwargs):
+        calls.append(args)
+        return net_connections(*args, **kwargs)
+
+    monkeypatch.setattr(psutil, "net_connections", counting_net_connections)
+
+    collector = HealthCollector(top_processes=5, include_all_connections=True,
+                                output_dir=str(tmp_path))
+    report = json.loads(Path(collector.run()).read_text())
+    network = report["network"]
+    lines = Path(network["all_connections_file"]).read_text().splitlines()
+
+    assert len(calls) == 1
+    assert len(lines) == network["summary"]["total_connections"]
@@ -0,0 +1,44 @@
+"""
+Tests for log file writing.
+"""
+
+import json
+from pathlib import Path
+
+from health_monitor import HealthCollector, HealthLogger
+
+
+def test_collect_all_connections_are_serializable_and_reusable(tmp_path):
+    """collect_all() returns a plain list that can be written more than once."""
+    collector = HealthCollector(top_processes=5, include_all_connections=True,
+                                output_dir=str(tmp_path))
+    data = collector.collect_all()
+    connections = data["network"]["all_connections"]
+    assert isinstance(connections, list)
+    json.dumps(data, default=str)
+
+    logger = HealthLogger(output_dir=str(tmp_path))
+    for _ in range(2):
+        report = json.loads(Path(logger.write_log(data)).read_text())
+        sidecar = Path(report["network"]["all_connections_file"])
+        lines = sidecar.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == connections
+        assert "all_connections" not in report["network"]
+
+
+
+def test_system_info_is_not_shared_between_reports(tmp_path, monkeypatch):
+    """Editing one report's system_info does not leak into later reports."""
+    seen = []
+
+    def recording_format_text(self, data):
+        seen.append(dict(data["system_info"]))
+        data["system_info"]["hostname"] = "edited"
+        return ""
+
+    monkeypatch.setattr(HealthLogger, "format_text", recording_format_text)
+    logger = HealthLogger(output_dir=str(tmp_path), format="text")
+    logger.write_log({"network": {}})
+    logger.write_log({"network": {}})
+
+    assert seen[1]["hostname"] != "edited"
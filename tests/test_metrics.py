@@ -0,0 +1,63 @@
+"""
+Tests for system metrics collection.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import psutil
+
+from health_monitor import metrics
+from health_monitor.metrics import collect_all_metrics, collect_disk_metrics
+
+
+def test_collect_all_metrics_samples_its_own_window_on_any_thread():
+    """An unprimed thread still measures load over a fresh sampling window."""
+    result = {}
+    busy = subprocess.Popen([sys.executable, "-c", "while True: pass"])
+    try:
+        worker = threading.Thread(target=lambda: result.update(collect_all_metrics()))
+        worker.start()
+        worker.join()
+    finally:
+        busy.kill()
+        busy.wait()
+
+    assert result["cpu"]["cpu_percent"] > 0.0
+    assert sum(result["cpu"]["cpu_per_core"]) > 0.0
+
+
+def test_collect_disk_metrics_skips_unresponsive_mounts(monkeypatch):
+    """A hung disk_usage call is dropped once DISK_USAGE_TIMEOUT elapses."""
+    partitions = [
+        SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4"),
+        SimpleNamespace(device="server:/export", mountpoint="/mnt/stale", fstype="nfs"),
+        SimpleNamespace(device="tmpfs", mountpoint="/run", fstype="tmpfs")
+    ]
+    usage = SimpleNamespace(total=100, used=40, free=60, percent=40.0)
+    release = threading.Event()
+    queried = []
+
+    def fake_disk_usage(mountpoint):
+        queried.append(mountpoint)
+        if mountpoint == "/mnt/stale":
+            release.wait()
+        return usage
+
+    monkeypatch.setattr(psutil, "disk_partitions", lambda all=False: partitions)
+    monkeypatch.setattr(psutil, "disk_usage", fake_disk_usage)
+    monkeypatch.setattr(metrics, "DISK_USAGE_TIMEOUT", 0.5)
+
+    try:
+        start = time.monotonic()
+        disk_info = collect_disk_metrics()
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert list(disk_info) == ["/"]
+    assert "/run" not in queried
+    assert elapsed < 0.5 + 0.5
@@ -0,0 +1,47 @@
+"""
+Tests for process enumeration.
+"""
+
+import sys
+
+import pytest
+
+from health_monitor.processes import _count_statuses_from_proc, _count_statuses_from_psutil
+
+
+def _write_stat(proc_root, pid, line):
+    pid_dir = proc_root / str(pid)
+    pid_dir.mkdir()
+    (pid_dir / "stat").write_bytes(line)
+
+
+def test_count_statuses_from_proc_parses_stat_lines(tmp_path):
+    """The state after the last ')' is used; unlisted states count as other."""
+    _write_stat(tmp_path, 123, b"123 (a) b) S 1 123 123 0 -1\n")
+    _write_stat(tmp_path, 124, b"124 (bash) R 1 124 124 0 -1\n")
+    _write_stat(tmp_path, 125, b"125 (sleep) T 1 125 125 0 -1\n")
+    _write_stat(tmp_path, 126, b"126 (defunct) Z 1 126 126 0 -1\n")
+    _write_stat(tmp_path, 127, b"127 (nfsd) D 2 0 0 0 -1\n")
+    _write_stat(tmp_path, 128, b"128 (gdb target) t 1 128 128 0 -1\n")
+    _write_stat(tmp_path, 129, b"129 (kworker/0:1) I 2 0 0 0 -1\n")
+    (tmp_path / "self").mkdir()
+
+    assert _count_statuses_from_proc(str(tmp_path)) == {
+        "running": 1,
+        "sleeping": 1,
+        "stopped": 1,
+        "zombie": 1,
+        "other": 3
+    }
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_count_statuses_from_proc_matches_psutil():
+    """The /proc fast path agrees with the psutil fallback."""
+    from_proc = _count_statuses_from_proc()
+    from_psutil = _count_statuses_from_psutil()
+
+    # Allow for processes starting or exiting between the two walks
+    assert abs(sum(from_proc.values()) - sum(from_psutil.values())) <= 2
+    for status in ("running", "sleeping", "stopped", "zombie", "other"):
+        assert abs(from_proc[status] - from_psutil[status]) <= 2